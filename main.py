@@ -5,6 +5,31 @@
 # sqlite3 = built-in lightweight database
 import sqlite3
 
+# json = turns Python lists into JSON text (used to store tags)
+import json
+
+# re = regular expressions (used to split tags)
+import re
+
+# time.monotonic = a clock for timing how old cached results are
+import time
+
+# atexit = runs cleanup code when the program exits
+import atexit
+
+# functools.lru_cache = remembers recent function results
+import functools
+
+# concurrent.futures = runs work on a background thread
+import concurrent.futures
+
+# contextlib = helpers for writing "with" blocks
+import contextlib
+
+# queue / threading = thread-safe building blocks for the connection pool
+import queue
+import threading
+
 # tkinter = built-in Python GUI toolkit
 import tkinter as tk
 
@@ -19,126 +44,527 @@ from tkinter import ttk, messagebox
 # Name of the SQLite database file
 DB_NAME = "snippets.db"
 
+# The shared connection pool (created on first use by _pool())
+_POOL = None
+
+# The empty search (the list shown at startup) is cached as (time, rows)
+# and reused for this many seconds, or until a snippet changes
+_BLANK_CACHE_TTL = 5.0
+_BLANK_CACHE = None
+
+# Splits tags on commas, eating any spaces around each comma
+_TAG_SPLIT = re.compile(r"\s*,\s*")
+
+# Whether this SQLite build has the FTS5 full-text search module.
+# Some builds leave it out; init_db() then sets this to False and
+# searches fall back to the search_blob column instead.
+_HAS_FTS5 = True
+
+
+# ==============================
+# SQL statements
+# Kept as constants so every call passes the exact same string,
+# which lets sqlite3 reuse its compiled (prepared) statement.
+# ==============================
+
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS snippets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        language TEXT NOT NULL,
+        tags TEXT NOT NULL,
+        status TEXT NOT NULL,
+        code TEXT NOT NULL,
+        notes TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        tags_json TEXT
+    )
+"""
+
+# tags_json = the same tags as a lowercased JSON array, e.g. ["sql", "python"],
+# so SQLite's json_each() can look at one tag at a time. Tags are lowercased
+# in Python (see _tags_json) because SQLite's lower() only handles ASCII.
+# (Databases made before this column existed get it added by init_db.)
+_ADD_TAGS_JSON_SQL = "ALTER TABLE snippets ADD COLUMN tags_json TEXT"
+
+_CREATE_TAGS_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_snippets_tags ON snippets (tags_json)"
+
+# Keeps only snippets that have every tag in the JSON list passed in
+# (an empty list '[]' keeps everything). Shared by all the search queries.
+_TAG_FILTER_SQL = """
+    NOT EXISTS (
+        SELECT 1 FROM json_each(?) AS wanted
+        WHERE wanted.value NOT IN (SELECT value FROM json_each(s.tags_json))
+    )
+"""
+
+# Lets "newest first" listings read rows already in order instead of sorting them
+_CREATE_UPDATED_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_snippets_updated
+    ON snippets (updated_at DESC, id)
+"""
+
+# FTS5 = SQLite's built-in full-text search index.
+# "content='snippets'" means the index reads its text from the snippets table
+# instead of keeping a second copy; the triggers below keep it in sync.
+_CREATE_FTS_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS snippets_fts USING fts5(
+        title, language, tags, code, notes,
+        content='snippets', content_rowid='id'
+    )
+"""
+
+# One statement per string: executescript() would commit the
+# transaction init_db() wraps them in, so they're run one at a time.
+_CREATE_FTS_TRIGGERS_SQL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS snippets_fts_insert AFTER INSERT ON snippets BEGIN
+        INSERT INTO snippets_fts (rowid, title, language, tags, code, notes)
+        VALUES (new.id, new.title, new.language, new.tags, new.code, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS snippets_fts_delete AFTER DELETE ON snippets BEGIN
+        INSERT INTO snippets_fts (snippets_fts, rowid, title, language, tags, code, notes)
+        VALUES ('delete', old.id, old.title, old.language, old.tags, old.code, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS snippets_fts_update AFTER UPDATE ON snippets BEGIN
+        INSERT INTO snippets_fts (snippets_fts, rowid, title, language, tags, code, notes)
+        VALUES ('delete', old.id, old.title, old.language, old.tags, old.code, old.notes);
+        INSERT INTO snippets_fts (rowid, title, language, tags, code, notes)
+        VALUES (new.id, new.title, new.language, new.tags, new.code, new.notes);
+    END
+    """,
+)
+
+# Fills the index from rows that existed before the index was created
+_REBUILD_FTS_SQL = "INSERT INTO snippets_fts (snippets_fts) VALUES ('rebuild')"
+
+# ----- Fallback search (only used when SQLite has no FTS5) -----
+# search_blob = every searchable field, lowercased and joined into one
+# column, so a search is one LIKE per row instead of five.
+# It's built in Python (see _search_blob) because SQLite's lower() and
+# LIKE only handle ASCII letters, while db_search lowercases the query
+# with Python's str.lower(), which handles e.g. "Ä" -> "ä" too.
+_ADD_SEARCH_BLOB_SQL = "ALTER TABLE snippets ADD COLUMN search_blob TEXT"
+
+_SET_SEARCH_BLOB_SQL = "UPDATE snippets SET search_blob = ? WHERE id = ?"
+
+_BLOB_SEARCH_SQL = f"""
+    SELECT id, title, language, tags, status
+    FROM snippets s
+    WHERE search_blob LIKE ?
+      AND {_TAG_FILTER_SQL}
+    ORDER BY updated_at DESC
+    LIMIT 200
+"""
+
+# Used for an empty search box: just the most recently edited snippets
+_RECENT_SQL = f"""
+    SELECT id, title, language, tags, status
+    FROM snippets s
+    WHERE {_TAG_FILTER_SQL}
+    ORDER BY updated_at DESC
+    LIMIT 200
+"""
+
+_SEARCH_SQL = f"""
+    SELECT s.id, s.title, s.language, s.tags, s.status
+    FROM snippets_fts f
+    JOIN snippets s ON s.id = f.rowid
+    WHERE snippets_fts MATCH ?
+      AND {_TAG_FILTER_SQL}
+    ORDER BY rank
+    LIMIT 200
+"""
+
+_GET_SQL = """
+    SELECT code, IFNULL(notes, '') AS notes
+    FROM snippets
+    WHERE id = ?
+"""
+
+# Insert-or-update in one statement ("upsert").
+# A NULL id makes SQLite pick a new one; an existing id updates that row.
+_UPSERT_SQL = """
+    INSERT INTO snippets (id, title, language, tags, tags_json, status, code, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title,
+        language = excluded.language,
+        tags = excluded.tags,
+        tags_json = excluded.tags_json,
+        status = excluded.status,
+        code = excluded.code,
+        notes = excluded.notes,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# The saved snippet's row as the results list shows it
+_LIST_ROW_SQL = """
+    SELECT id, title, language, tags, status
+    FROM snippets
+    WHERE id = ?
+"""
+
+_DELETE_SQL = "DELETE FROM snippets WHERE id = ?"
+
 
 # ==============================
 # Database functions
 # ==============================
 
+def _connect(path):
+    """
+    Open one tuned connection to the database file.
+    """
+    # check_same_thread=False: the pool hands connections between threads,
+    # but only ever to one thread at a time.
+    # cached_statements = how many compiled queries sqlite3 keeps around
+    # isolation_level=None = autocommit: each write commits on its own,
+    # and multi-statement work uses an explicit BEGIN ... COMMIT.
+    conn = sqlite3.connect(
+        path,
+        check_same_thread=False,
+        cached_statements=256,
+        isolation_level=None,
+    )
+    # Rows can be read by column name as well as by position
+    conn.row_factory = sqlite3.Row
+
+    # Tune SQLite once per connection:
+    #  - WAL journal + NORMAL sync = far fewer fsyncs on save,
+    #    and readers never block the writer (or each other)
+    #  - 64 MB page cache + 256 MB mmap keep the table in memory
+    #  - temp tables/sorts stay in RAM instead of on disk
+    conn.executescript("""
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA cache_size = -65536;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA foreign_keys = ON;
+    """)
+    return conn
+
+
+class SqlitePool:
+    """
+    A small pool of long-lived connections to one database file.
+    SQLite allows only one writer at a time but many readers (in WAL
+    mode), so there is one write connection and several read ones.
+
+        with pool.read() as conn: ...   # searches, loading a snippet
+        with pool.write() as conn: ...  # saving, deleting, schema setup
+    """
+
+    def __init__(self, path, readers=4):
+        # Open the writer first so WAL mode is on before any reader connects
+        self._writer = _connect(path)
+        self._write_lock = threading.Lock()
+
+        self._readers = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(_connect(path))
+
+    @contextlib.contextmanager
+    def read(self):
+        """Borrow a read connection (waits if they're all in use)."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextlib.contextmanager
+    def write(self):
+        """Use the write connection (one thread at a time)."""
+        with self._write_lock:
+            yield self._writer
+
+    def close(self):
+        """Close every connection in the pool."""
+        with self._write_lock:
+            self._writer.close()
+        while not self._readers.empty():
+            self._readers.get().close()
+
+
+def _pool():
+    """
+    Return the shared connection pool, opening it on first use.
+    Reusing connections avoids reopening the file on every query
+    and keeps SQLite's page cache warm between searches.
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = SqlitePool(DB_NAME)
+    return _POOL
+
+
+# Close the pool's connections cleanly when the app exits
+atexit.register(lambda: _POOL and _POOL.close())
+
+
 def init_db():
     """
     Create the database and snippets table if it doesn't already exist.
     This runs once when the app starts.
     """
-    with sqlite3.connect(DB_NAME) as conn:
+    global _HAS_FTS5
+
+    with _pool().write() as conn:
         cur = conn.cursor()
 
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS snippets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                language TEXT NOT NULL,
-                tags TEXT NOT NULL,
-                status TEXT NOT NULL,
-                code TEXT NOT NULL,
-                notes TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        # Do all schema setup in one transaction, so it's a single disk flush
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            cur.execute(_CREATE_TABLE_SQL)
+            cur.execute(_CREATE_UPDATED_INDEX_SQL)
+            _init_tags_json(cur)
+
+            # Check before creating: an index added to an existing database
+            # has to be filled with the snippets that are already there.
+            cur.execute("SELECT 1 FROM sqlite_master WHERE name = 'snippets_fts'")
+            fts_is_new = cur.fetchone() is None
+
+            try:
+                cur.execute(_CREATE_FTS_SQL)
+            except sqlite3.OperationalError:
+                # "no such module: fts5" - use the search_blob column instead
+                _HAS_FTS5 = False
+
+            if _HAS_FTS5:
+                for sql in _CREATE_FTS_TRIGGERS_SQL:
+                    cur.execute(sql)
+                if fts_is_new:
+                    cur.execute(_REBUILD_FTS_SQL)
+            else:
+                _init_search_blob(cur)
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+
+        cur.execute("COMMIT")
+
+
+def _has_column(cur, column):
+    """Check whether the snippets table has the given column."""
+    cur.execute("SELECT 1 FROM pragma_table_info('snippets') WHERE name = ?", (column,))
+    return cur.fetchone() is not None
+
+
+def _split_tags(tags):
+    """Turn "a, b,,c " into ["a", "b", "c"]."""
+    return [t for t in _TAG_SPLIT.split(tags.strip()) if t]
+
+
+def _tags_json(tag_list):
+    """Turn ["SQL", "Über"] into the JSON text '["sql", "über"]' for tags_json."""
+    return json.dumps([t.lower() for t in tag_list])
+
+
+def _init_tags_json(cur):
+    """
+    Set up the tags_json column and its index.
+    Adds the column to older databases and fills it for existing rows.
+    """
+    if not _has_column(cur, "tags_json"):
+        cur.execute(_ADD_TAGS_JSON_SQL)
+    cur.execute(_CREATE_TAGS_INDEX_SQL)
+
+    cur.execute("SELECT id, tags FROM snippets WHERE tags_json IS NULL")
+    missing = cur.fetchall()
+    if missing:
+        cur.executemany(
+            "UPDATE snippets SET tags_json = ? WHERE id = ?",
+            [(_tags_json(_split_tags(row["tags"])), row["id"]) for row in missing],
+        )
+
+
+def _init_search_blob(cur):
+    """
+    Set up the search_blob column used when FTS5 isn't available.
+    Adds the column to older databases and fills it for existing rows.
+    """
+    if not _has_column(cur, "search_blob"):
+        cur.execute(_ADD_SEARCH_BLOB_SQL)
+
+    cur.execute(
+        "SELECT id, title, language, tags, code, notes FROM snippets WHERE search_blob IS NULL"
+    )
+    missing = cur.fetchall()
+    if missing:
+        cur.executemany(
+            _SET_SEARCH_BLOB_SQL,
+            [
+                (_search_blob(r["title"], r["language"], r["tags"], r["code"], r["notes"]), r["id"])
+                for r in missing
+            ],
+        )
 
-        conn.commit()
+
+def _search_blob(title, language, tags, code, notes):
+    """Join the searchable fields into one lowercased string for search_blob."""
+    return " ".join((title, language, tags, code, notes or "")).lower()
 
 
 def db_search(query: str):
     """
     Search snippets by keyword across multiple fields.
     Returns lightweight rows for the results list.
+    Words like tag:sql only keep snippets with that exact tag.
+    Repeated searches are answered from memory until a snippet changes.
+    """
+    # Both search methods ignore case, so "Foo" and "foo" can share a cache entry.
+    query = query.strip().lower()
+    if not query:
+        return _recent_snippets()
+    return _search_cached(query)
+
+
+def _recent_snippets():
+    """
+    The newest snippets, for an empty search box.
+    This is the most common search (startup, clearing the box), so the
+    rows are kept for a few seconds and reused without asking SQLite.
+    """
+    global _BLANK_CACHE
+    if _BLANK_CACHE is not None:
+        cached_at, rows = _BLANK_CACHE
+        if time.monotonic() - cached_at < _BLANK_CACHE_TTL:
+            return rows
+
+    with _pool().read() as conn:
+        rows = _run_search(conn.cursor(), "")
+    _BLANK_CACHE = (time.monotonic(), rows)
+    return rows
+
+
+@functools.lru_cache(maxsize=128)
+def _search_cached(query: str):
+    """
+    Run the actual search query.
+    Results are a tuple so the cached value can't be changed by callers.
     """
+    with _pool().read() as conn:
+        return _run_search(conn.cursor(), query)
 
-    ''' Match snippets where any of the fields contain the query string.
-        % is used as a wildcard for LIKE operator in SQL.
+
+def _parse_query(query):
+    """
+    Split lowercased search text into (text, tags).
+    "tag:sql join tag:pg" -> ("join", ["sql", "pg"])
+    """
+    words = query.split()
+    tags = [w[4:] for w in words if w.startswith("tag:") and len(w) > 4]
+    text = " ".join(w for w in words if not w.startswith("tag:"))
+    return text, tags
+
+
+def _run_search(cur, query):
+    """Pick and run the right search query for the (lowercased) search text."""
+    # Pull out tag:name words; the rest of the query is searched as text
+    query, tags = _parse_query(query)
+    wanted_tags = json.dumps(tags)
+
+    if not query:
+        cur.execute(_RECENT_SQL, (wanted_tags,))
+        return tuple(cur.fetchall())
+
+    if not _HAS_FTS5:
+        # % is used as a wildcard for LIKE operator in SQL.
+        cur.execute(_BLOB_SEARCH_SQL, (f"%{query}%", wanted_tags))
+        return tuple(cur.fetchall())
+
+    ''' Turn each word into a quoted prefix term, e.g. con log -> "con"* "log"*
+        so every word must appear at the start of some word in the snippet.
+        Quoting stops characters like - or ( being read as search operators.
+        Words with no letters or digits can never match, so they're dropped.
     '''
-    q = f"%{query.strip()}%"
+    terms = [
+        '"' + word.replace('"', '""') + '"*'
+        for word in query.split()
+        if any(ch.isalnum() for ch in word)
+    ]
+    if not terms:
+        return ()
 
-    ''' Connects to the database and is requesting up to 200 snippets
-        that match the search query in any of the specified fields.'''
-    with sqlite3.connect(DB_NAME) as conn:
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT id, title, language, tags, status
-            FROM snippets
-            WHERE title LIKE ?
-               OR language LIKE ?
-               OR tags LIKE ?
-               OR code LIKE ?
-               OR IFNULL(notes, '') LIKE ?
-            ORDER BY updated_at DESC
-            LIMIT 200
-        """, (q, q, q, q, q))
-
-        return cur.fetchall()
+    ''' Requests up to 200 snippets, best matches first.'''
+    cur.execute(_SEARCH_SQL, (" ".join(terms), wanted_tags))
+
+    return tuple(cur.fetchall())
+
+
+def _invalidate_search_cache():
+    """Forget cached search results. Called after every write."""
+    global _BLANK_CACHE
+    _BLANK_CACHE = None
+    _search_cached.cache_clear()
 
 # This is used when the user clicks on a snippet from the list to load the full snippet details.
 def db_get(snippet_id: int):
     """
-    Fetch a full snippet by ID.
-    Used when clicking a result.
+    Fetch a snippet's code and notes by ID.
+    Used when clicking a result (the other fields are already in the list).
     """
-    with sqlite3.connect(DB_NAME) as conn:
+    with _pool().read() as conn:
         cur = conn.cursor()
-        cur.execute("""
-            SELECT id, title, language, tags, status, code, IFNULL(notes, '')
-            FROM snippets
-            WHERE id = ?
-        """, (snippet_id,))
+        cur.execute(_GET_SQL, (snippet_id,))
 
         return cur.fetchone()
 
-# This adds a new snippet to the database and returns the ID of the newly created snippet.
-def db_insert(title, language, tags, status, code, notes):
+# This saves a snippet in one round trip: a new one when snippet_id is None,
+# otherwise it updates that snippet and sets updated_at to the current time.
+def db_upsert(snippet_id, title, language, tags, status, code, notes):
     """
-    Insert a brand-new snippet.
+    Insert a new snippet or update an existing one.
+    Tags are cleaned up here ("a, b,,c " -> "a,b,c") and also stored as JSON.
+    Returns the saved row as the results list shows it (id, title, language, tags, status).
     """
-    with sqlite3.connect(DB_NAME) as conn:
+    tag_list = _split_tags(tags)
+    tags = ",".join(tag_list)
+
+    with _pool().write() as conn:
         cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO snippets (title, language, tags, status, code, notes)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (title, language, tags, status, code, notes))
+        # The upsert, the fallback search column and reading the saved row
+        # back all happen in one transaction
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            cur.execute(
+                _UPSERT_SQL,
+                (snippet_id, title, language, tags, _tags_json(tag_list), status, code, notes),
+            )
+            # No RETURNING here (it needs SQLite 3.35+): a new snippet's id
+            # is lastrowid, an existing one keeps the id it was saved with
+            saved_id = snippet_id if snippet_id is not None else cur.lastrowid
 
-        conn.commit()
-        return cur.lastrowid
+            if not _HAS_FTS5:
+                blob = _search_blob(title, language, tags, code, notes)
+                cur.execute(_SET_SEARCH_BLOB_SQL, (blob, saved_id))
 
-#  This updates an existing snippet in the database with new values and sets the updated_at timestamp to the current time.
-def db_update(snippet_id, title, language, tags, status, code, notes):
-    """
-    Update an existing snippet.
-    """
-    with sqlite3.connect(DB_NAME) as conn:
-        cur = conn.cursor()
-        cur.execute("""
-            UPDATE snippets
-            SET title = ?,
-                language = ?,
-                tags = ?,
-                status = ?,
-                code = ?,
-                notes = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (title, language, tags, status, code, notes, snippet_id))
-
-        conn.commit()
+            cur.execute(_LIST_ROW_SQL, (saved_id,))
+            saved = cur.fetchone()
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+
+        cur.execute("COMMIT")
+
+    _invalidate_search_cache()
+    return saved
 
 #  This permanently deletes a snippet from the database based on its ID.
 def db_delete(snippet_id):
     """
     Permanently delete a snippet.
     """
-    with sqlite3.connect(DB_NAME) as conn:
-        cur = conn.cursor()
-        cur.execute("DELETE FROM snippets WHERE id = ?", (snippet_id,))
-        conn.commit()
+    with _pool().write() as conn:
+        conn.execute(_DELETE_SQL, (snippet_id,))
+    _invalidate_search_cache()
 
 
 # ==============================
@@ -166,6 +592,40 @@ class SnippetArsenalApp(tk.Tk):
         # If None, no snippet is selected (new snippet mode)
         self.selected_id = None
 
+        # The code as last loaded or saved. Tk's edit_modified() flag says
+        # whether it's been edited since; saving an unedited snippet reuses
+        # this instead of copying the whole editor contents back out of Tk.
+        self._loaded_code = ""
+
+        # ID of the pending "search as you type" timer (see schedule_search)
+        self._search_job = None
+
+        # What the results list is showing right now: snippet id -> its search row.
+        # Each row's Treeview item ID (iid) is its snippet id as a string.
+        self._displayed = {}
+
+        # All database work runs on this single background thread, so a slow
+        # query never freezes the window. One thread also means writes are
+        # never in each other's way.
+        self._db_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="snippet-db"
+        )
+
+        # Counts searches started, so results from an older search that
+        # finishes late can be ignored
+        self._search_generation = 0
+
+        # True from starting a search until all its rows are on screen
+        self._results_pending = False
+
+        # Bumped whenever the editor switches to another snippet (or a blank
+        # one), so a load/save/delete that finishes late can tell the user
+        # has moved on
+        self._editor_version = 0
+
+        # True while a save is running, so a double-click can't save twice
+        self._saving = False
+
         # ==============================
         # Top bar (Search + New)
         # Creates the search input and buttons at the top of the window.
@@ -182,6 +642,10 @@ class SnippetArsenalApp(tk.Tk):
         self.search_entry.pack(side="left", padx=8)
         # Makes it so that pressing Enter in the search box triggers a search.
         self.search_entry.bind("<Return>", lambda e: self.refresh_results())
+        # Search as you type (waits for a short pause in typing first).
+        # Tracing the variable only reacts to real text changes, not to
+        # arrow keys, Shift, Tab or the Enter that already searched.
+        self.search_var.trace_add("write", self.schedule_search)
 
         # Search Button
         ttk.Button(top, text="Search", command=self.refresh_results).pack(side="left")
@@ -290,14 +754,151 @@ class SnippetArsenalApp(tk.Tk):
     # UI Logic Methods
     # ==============================
 
+    def schedule_search(self, *args):
+        """
+        Run a search shortly after the user stops typing.
+        Each change to the search text restarts the 200 ms timer, so a burst of typing
+        only hits the database once.
+        """
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(200, self.refresh_results)
+
+    def destroy(self):
+        """Stop the database thread when the window closes."""
+        self._db_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+    def _run_db(self, func, *args, then):
+        """
+        Run a database function on the database thread, then call
+        then(result) on the Tk thread once it's done.
+        Used for single-row work (load, save, delete): it queues up behind
+        any search already running without freezing the window.
+        """
+        future = self._db_executor.submit(func, *args)
+        self._wait_for_db(future, then)
+
+    def _wait_for_db(self, future, then):
+        """Check back every few milliseconds until a _run_db job is done."""
+        if not future.done():
+            self.after(10, self._wait_for_db, future, then)
+            return
+
+        try:
+            result = future.result()
+        except Exception as exc:
+            self._saving = False
+            messagebox.showerror("Database error", str(exc))
+            return
+
+        then(result)
+
     def refresh_results(self):
-        """Refresh the search results list."""
-        for item in self.results.get_children():
-            self.results.delete(item)
+        """Start a search in the background; _apply_results shows the rows."""
+        # A search running now makes any pending timed search redundant
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+
+        self._search_generation += 1
+        generation = self._search_generation
+        self._results_pending = True
+
+        future = self._db_executor.submit(db_search, self.search_var.get())
+        self._wait_for_results(generation, future)
+
+    def _wait_for_results(self, generation, future):
+        """
+        Check (on the Tk thread) whether a background search has finished.
+        Tk widgets must only be touched from Tk's own thread, so instead of
+        the database thread calling back into Tk, Tk keeps checking back
+        every few milliseconds until the rows are ready.
+        """
+        # A newer search has started since this one, so these rows are out of date
+        if generation != self._search_generation:
+            return
 
-        rows = db_search(self.search_var.get())
-        for r in rows:
-            self.results.insert("", "end", values=r)
+        if not future.done():
+            self.after(10, self._wait_for_results, generation, future)
+            return
+
+        try:
+            rows = future.result()
+        except Exception as exc:
+            self._results_pending = False
+            messagebox.showerror("Search failed", str(exc))
+            return
+
+        self._apply_results(rows)
+
+    def _apply_results(self, rows):
+        """Show the rows from a finished search in the results list."""
+
+        new = [(row["id"], row) for row in rows]
+        new_ids = {sid for sid, _ in new}
+
+        ''' Only touch the rows that actually changed instead of clearing
+            and refilling the whole list. Every Treeview call is a round
+            trip into Tk, so after saving one snippet this is a couple of
+            calls rather than hundreds.'''
+        stale = [sid for sid in self._displayed if sid not in new_ids]
+        if stale:
+            self.results.delete(*(str(sid) for sid in stale))
+            for sid in stale:
+                del self._displayed[sid]
+
+        # Rows still on screen, top to bottom
+        shown = [int(iid) for iid in self.results.get_children()]
+        self._show_rows(self._search_generation, new, 0, shown)
+
+    def _show_rows(self, generation, new, start, shown):
+        """
+        Put the next chunk of search rows into the results list.
+        The first 50 rows appear straight away and the rest follow in
+        later chunks, so a big result list starts showing immediately
+        instead of the window waiting for every row.
+        """
+        # A newer search has taken over the list
+        if generation != self._search_generation:
+            return
+
+        chunk = new[start:start + 50]
+        added = [sid for sid, _ in chunk if sid not in self._displayed]
+
+        # Many new rows at once (e.g. the first load): take the list off
+        # screen while filling it, so Tk lays it out once at the end
+        # instead of after every inserted row.
+        bulk = len(added) > 20
+        if bulk:
+            self.results.pack_forget()
+
+        for sid, row in chunk:
+            # sqlite3.Row isn't a tuple, so convert it for the Treeview
+            if sid not in self._displayed:
+                self.results.insert("", "end", iid=str(sid), values=tuple(row))
+            elif self._displayed[sid] != row:
+                self.results.item(str(sid), values=tuple(row))
+            self._displayed[sid] = row
+
+        ''' Rows handled so far go on top in search order, followed by the
+            older rows that later chunks will sort out. One call reorders
+            the whole list, and only when the order is actually wrong.'''
+        done = [sid for sid, _ in new[:start + len(chunk)]]
+        done_ids = set(done)
+        shown = done + [sid for sid in shown if sid not in done_ids]
+        order = tuple(str(sid) for sid in shown)
+        if self.results.get_children() != order:
+            self.results.set_children("", *order)
+
+        if bulk:
+            self.results.pack(fill="both", expand=True)
+
+        if start + len(chunk) < len(new):
+            # Let Tk draw this chunk (~one frame) before adding the next
+            self.after(16, self._show_rows, generation, new, start + len(chunk), shown)
+        else:
+            self._results_pending = False
 
     def on_select(self, event=None):
         """Load selected snippet into the editor."""
@@ -305,61 +906,146 @@ class SnippetArsenalApp(tk.Tk):
         if not sel:
             return
 
-        snippet_id = int(self.results.item(sel[0], "values")[0])
-        row = db_get(snippet_id)
+        # The item ID is the snippet id. Title, language, tags and status
+        # come from the row already in the list; only code and notes need
+        # the database. (self._displayed keeps the original values; reading
+        # them back from the Treeview would turn e.g. a title "007" into 7.)
+        snippet_id = int(sel[0])
+        self._run_db(
+            db_get, snippet_id,
+            then=lambda details: self._load_snippet(snippet_id, details),
+        )
 
-        self.selected_id = row[0]
-        self.title_var.set(row[1])
-        self.lang_var.set(row[2])
-        self.tags_var.set(row[3])
-        self.status_var.set(row[4])
+    def _load_snippet(self, snippet_id, details):
+        """Fill the editor once a snippet's code and notes have loaded."""
+        # The user clicked somewhere else (or the row left the list)
+        # while this was loading
+        row = self._displayed.get(snippet_id)
+        if row is None or self.results.selection() != (str(snippet_id),):
+            return
 
-        self.code_text.delete("1.0", "end")
-        self.code_text.insert("1.0", row[5])
+        self._editor_version += 1
+        self.selected_id = snippet_id
+        self.title_var.set(row["title"])
+        self.lang_var.set(row["language"])
+        self.tags_var.set(row["tags"])
+        self.status_var.set(row["status"])
+
+        self._set_code(details["code"])
 
         self.notes_text.delete("1.0", "end")
-        self.notes_text.insert("1.0", row[6])
+        self.notes_text.insert("1.0", details["notes"])
 
     def new_snippet(self):
         """Clear the editor to create a new snippet."""
+        self._editor_version += 1
         self.selected_id = None
         self.title_var.set("")
         self.lang_var.set("py")
         self.tags_var.set("")
         self.status_var.set("draft")
-        self.code_text.delete("1.0", "end")
+        self._set_code("")
         self.notes_text.delete("1.0", "end")
 
+    def _set_code(self, code):
+        """Put code into the editor and mark it as unedited."""
+        self.code_text.delete("1.0", "end")
+        self.code_text.insert("1.0", code)
+        self._loaded_code = code
+        self.code_text.edit_modified(False)
+
     def save_snippet(self):
         """Insert or update a snippet."""
+        if self._saving:
+            return
+
         title = self.title_var.get().strip()
         language = self.lang_var.get().strip()
         tags = self.tags_var.get().strip()
         status = self.status_var.get().strip()
-        code = self.code_text.get("1.0", "end").strip()
+        # Only copy the code out of the editor if it has been edited
+        if self.code_text.edit_modified():
+            code = self.code_text.get("1.0", "end").strip()
+        else:
+            code = self._loaded_code.strip()
         notes = self.notes_text.get("1.0", "end").strip()
 
         if not title or not language or not tags or not code:
             messagebox.showerror("Error", "Title, language, tags, and code are required.")
             return
 
-        tags = ",".join(t.strip() for t in tags.split(",") if t.strip())
+        # The code being saved is the new "unedited" version; any typing
+        # while the save runs marks it as edited again
+        self._loaded_code = code
+        self.code_text.edit_modified(False)
 
-        if self.selected_id is None:
-            self.selected_id = db_insert(title, language, tags, status, code, notes)
-        else:
-            db_update(self.selected_id, title, language, tags, status, code, notes)
+        self._saving = True
+        version = self._editor_version
+        self._run_db(
+            db_upsert, self.selected_id, title, language, tags, status, code, notes,
+            then=lambda saved: self._finish_save(version, saved),
+        )
 
-        self.refresh_results()
+    def _finish_save(self, version, saved):
+        """Update the editor and results list once a save has finished."""
+        self._saving = False
+        # Only link the editor to the saved snippet if it still shows it
+        if version == self._editor_version:
+            self.selected_id = saved["id"]
+
+        self._show_saved_row(saved)
         messagebox.showinfo("Saved", "Snippet saved.")
 
+    def _show_saved_row(self, saved):
+        """
+        Update the results list after a save.
+        With an empty search (or only tag: words) the list is simply the
+        newest snippets, so the saved row can be updated in place and moved
+        to the top without searching again - or dropped, if its tags no
+        longer match. Keyword searches, brand-new snippets and searches
+        still loading re-run the search (the cache was cleared by the save).
+        """
+        sid = saved["id"]
+        text, wanted_tags = _parse_query(self.search_var.get().strip().lower())
+        if text or self._results_pending:
+            self.refresh_results()
+            return
+
+        # Same check as the tag filter in SQL: every wanted tag must be present
+        saved_tags = {t.lower() for t in _split_tags(saved["tags"])}
+        matches = all(tag in saved_tags for tag in wanted_tags)
+
+        if sid not in self._displayed:
+            if matches:
+                self.refresh_results()
+            return
+
+        if not matches:
+            self.results.delete(str(sid))
+            del self._displayed[sid]
+            return
+
+        self._displayed[sid] = saved
+        self.results.item(str(sid), values=tuple(saved))
+        # Newest first, so the just-saved snippet goes to the top
+        self.results.move(str(sid), "", 0)
+
     def copy_code(self):
         """Copy code to clipboard."""
-        code = self.code_text.get("1.0", "end").strip()
-        if not code:
+        # Find the first and last non-space characters (like .strip()).
+        # Nothing to copy if the editor is empty or only whitespace.
+        first = self.code_text.search(r"\S", "1.0", "end", regexp=True)
+        if not first:
             return
-        self.clipboard_clear()
-        self.clipboard_append(code)
+        last = self.code_text.search(r"\S", "end", "1.0", backwards=True, regexp=True)
+
+        # Select that range and let Tk's own Copy put it on the clipboard,
+        # so the text never has to be copied into Python first. Then clear
+        # the selection again so the editor (and the X PRIMARY selection)
+        # are left as they were.
+        self.code_text.tag_add("sel", first, f"{last}+1c")
+        self.code_text.event_generate("<<Copy>>")
+        self.code_text.tag_remove("sel", "1.0", "end")
 
     def delete_snippet(self):
         """Delete the selected snippet."""
@@ -369,8 +1055,16 @@ class SnippetArsenalApp(tk.Tk):
         if not messagebox.askyesno("Confirm", "Delete this snippet?"):
             return
 
-        db_delete(self.selected_id)
-        self.new_snippet()
+        version = self._editor_version
+        self._run_db(
+            db_delete, self.selected_id,
+            then=lambda _: self._finish_delete(version),
+        )
+
+    def _finish_delete(self, version):
+        """Clear the editor (if it still shows the deleted snippet) and the list."""
+        if version == self._editor_version:
+            self.new_snippet()
         self.refresh_results()
 
 